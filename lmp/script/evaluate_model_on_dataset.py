@@ -222,14 +222,14 @@ def main() -> None:
         for batch_txt in tqdm(dldr):
 
             # Encode batch text into batch of token ids.
-            batch_tkids = tknzr.batch_enc(
+            batch_tkids = tknzr.batch_enc_np(
                 batch_txt=batch_txt,
                 max_seq_len=model_cfg.max_seq_len,
             )
 
             # Convert batch of token ids to `torch.Tensor` with
-            # `dtype == torch.int64`.
-            batch_tkids = torch.LongTensor(batch_tkids)
+            # `dtype == torch.int64` without copy.
+            batch_tkids = torch.from_numpy(batch_tkids)
 
             # Move tensors to model running device.
             batch_tkids = batch_tkids.to(device)
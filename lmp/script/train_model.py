@@ -288,14 +288,14 @@ def main() -> None:
         )
         for batch_txt in tqdm_dldr:
             # Encode batch text into batch token ids.
-            batch_tkids = tknzr.batch_enc(
+            batch_tkids = tknzr.batch_enc_np(
                 batch_txt=batch_txt,
                 max_seq_len=args.max_seq_len,
             )
 
             # Convert batch token ids to `torch.Tensor` with
-            # `dtype == torch.int64`.
-            batch_tkids = torch.LongTensor(batch_tkids)
+            # `dtype == torch.int64` without copy.
+            batch_tkids = torch.from_numpy(batch_tkids)
 
             # Move tensors to model running device.
             batch_tkids = batch_tkids.to(device)
@@ -74,6 +74,19 @@ different case.
         --min_count 5 \
         --ver train
 
+Use ``--n_worker`` to build vocabulary with multiple processes on large
+dataset.
+
+.. code-block:: sh
+
+    python -m lmp.script.train_tokenizer whitespace \
+        --dset_name wikitext-2 \
+        --exp_name my_exp \
+        --max_vocab 10000 \
+        --min_count 5 \
+        --n_worker 4 \
+        --ver train
+
 Use ``-h`` or ``--help`` options to get list of available tokenizers.
 
 .. code-block:: sh
@@ -138,7 +151,7 @@ def main() -> None:
     tknzr = lmp.util.tknzr.create(**args.__dict__)
 
     # Build tokenizer's vocabulary.
-    tknzr.build_vocab(dset)
+    tknzr.build_vocab(dset, n_worker=args.n_worker)
 
     # Save training result.
     tknzr.save(args.exp_name)
@@ -2,16 +2,30 @@ r""":term:`Tokenizer` base class."""
 
 import abc
 import argparse
+import functools
+import itertools
 import json
+import math
+import multiprocessing
 import os
 import typing
 from collections import Counter
-from typing import ClassVar, Dict, List, Optional, Sequence
+from typing import (Callable, ClassVar, Dict, Iterable, List, Optional,
+                    Sequence, Tuple)
+
+import numpy as np
 
 import lmp.dset
 import lmp.dset.util
 import lmp.path
 
+# `orjson` is optional.  It is used to speed up saving and loading large
+# vocabulary, and standard library `json` is used when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class BaseTknzr(abc.ABC):
     r""":term:`Tokenizer` abstract base class.
@@ -34,6 +48,10 @@ class BaseTknzr(abc.ABC):
         Token (a string) to id (an integer) lookup table.
         If ``tk2id is not None``, then initialize lookup table with ``tk2id``.
         Otherwise initialize lookup table with special tokens only.
+    enc_cache_size: int, optional
+        Maximum number of encoding results cached by ``self.enc()``.
+        Set to ``0`` to disable encoding cache.
+        Defaults to ``65536``.
     kwargs: Dict, optional
         Useless parameter.
         Left intended for subclass parameters extension.
@@ -50,6 +68,9 @@ class BaseTknzr(abc.ABC):
         Token which represents the end of a text.
         Text will be appended with ``self.__class__.eos_tk`` when encoded by
         ``self.enc()``.
+    enc_cache_size: int
+        Maximum number of encoding results cached by ``self.enc()``.
+        ``0`` means encoding cache is disabled.
     eos_tkid: ClassVar[int]
         Token id of ``self.__class__.eos_tk``.
     file_name: ClassVar[str]
@@ -73,6 +94,10 @@ class BaseTknzr(abc.ABC):
         Token id of ``self.__class__.pad_tk``.
     tk2id: Dict[str, int]
         Token (a string) to id (an integer) lookup table.
+        Vocabulary should be changed by ``self.build_vocab()``.
+        If tokens are added to or removed from ``self.tk2id`` directly, then
+        encoding cache is cleared on next encoding.
+        Token ids of existing tokens must not be changed in place.
     tknzr_name: ClassVar[str]
         Display name for tokenizer on CLI.
         Used for command line argument parsing.
@@ -109,6 +134,7 @@ class BaseTknzr(abc.ABC):
             min_count: int,
             *,
             tk2id: Optional[Dict[str, int]] = None,
+            enc_cache_size: int = 65536,
             **kwargs: Optional[Dict],
     ):
         if not isinstance(is_uncased, bool):
@@ -123,7 +149,8 @@ class BaseTknzr(abc.ABC):
         self.id2tk: Dict[int, str] = {}
         if tk2id is not None:
             self.tk2id = tk2id
-            self.id2tk = {v: k for k, v in tk2id.items()}
+            # Build inverse lookup table with `zip` so that the loop runs in C.
+            self.id2tk = dict(zip(tk2id.values(), tk2id.keys()))
         # Initialize vocabulary with special tokens.
         else:
             for tk, tkid in [
@@ -135,6 +162,81 @@ class BaseTknzr(abc.ABC):
                 self.tk2id[tk] = tkid
                 self.id2tk[tkid] = tk
 
+        # Token id of the next token added to vocabulary.
+        # Maintained by `self.build_vocab()` so that vocabulary does not need
+        # to be scanned every time.
+        self._next_id = max(self.tk2id.values(), default=-1) + 1
+
+        # Cache encoding results of recently encoded text.
+        self.enc_cache_size = enc_cache_size
+        self._init_enc_cache()
+
+    def __getstate__(self) -> Dict:
+        r"""Get picklable state of the tokenizer.
+
+        Encoding cache is not picklable and thus excluded.
+
+        Returns
+        =======
+        Dict
+            Tokenizer's instance attributes without encoding cache.
+        """
+        state = self.__dict__.copy()
+        del state['_enc_cache']
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        r"""Restore tokenizer from pickled state.
+
+        Encoding cache is re-created.
+
+        Parameters
+        ==========
+        state: Dict
+            Tokenizer's instance attributes without encoding cache.
+        """
+        self.__dict__.update(state)
+        self._init_enc_cache()
+
+    def _init_enc_cache(self) -> None:
+        r"""Create encoding cache with size ``self.enc_cache_size``.
+
+        Vocabulary used by cached encoding results is recorded, so that
+        ``self._get_enc()`` can detect vocabulary changes.
+        """
+        self._enc_cache = functools.lru_cache(
+            maxsize=max(0, self.enc_cache_size),
+        )(self._enc_tuple)
+        self._enc_cache_tk2id = self.tk2id
+        self._enc_cache_vocab_size = len(self.tk2id)
+
+    def _get_enc(self) -> Callable[[str, int], List[int]]:
+        r"""Get encoding function consistent with current vocabulary.
+
+        If encoding cache is disabled, ``self._enc()`` is returned directly so
+        that no intermediate copy is made.
+        Otherwise cache is cleared if ``self.tk2id`` is replaced, or if tokens
+        are added to or removed from ``self.tk2id`` since last encoding.
+
+        Returns
+        =======
+        Callable[[str, int], List[int]]
+            Function with the same signature as ``self._enc()``.
+        """
+        if self.enc_cache_size <= 0:
+            return self._enc
+
+        if (
+            self._enc_cache_tk2id is not self.tk2id
+            or self._enc_cache_vocab_size != len(self.tk2id)
+        ):
+            self._enc_cache.cache_clear()
+            self._enc_cache_tk2id = self.tk2id
+            self._enc_cache_vocab_size = len(self.tk2id)
+
+        enc_cache = self._enc_cache
+        return lambda txt, max_seq_len: list(enc_cache(txt, max_seq_len))
+
     def save(self, exp_name: str) -> None:
         r"""Save :term:`tokenizer` configuration in JSON format.
 
@@ -142,6 +244,7 @@ class BaseTknzr(abc.ABC):
         it with ``self.__class__.file_name``.
         This method will create experiment path first if experiment path does
         not exist.
+        If ``orjson`` is installed, then it will be used to speed up saving.
 
         Parameters
         ==========
@@ -166,8 +269,7 @@ class BaseTknzr(abc.ABC):
         >>> tknzr.save('my_exp')
         None
         """
-        file_dir = os.path.join(lmp.path.EXP_PATH, exp_name)
-        file_path = os.path.join(file_dir, self.__class__.file_name)
+        file_dir, file_path = self.__class__._file_path(exp_name)
 
         if not os.path.exists(file_dir):
             os.makedirs(file_dir)
@@ -178,17 +280,21 @@ class BaseTknzr(abc.ABC):
         elif os.path.isdir(file_path):
             raise FileExistsError(f'{file_path} is a directory.')
 
+        cfg = {
+            'is_uncased': self.is_uncased,
+            'max_vocab': self.max_vocab,
+            'min_count': self.min_count,
+            'tk2id': self.tk2id,
+        }
+
+        # `orjson` output UTF-8 encoded bytes.
+        if orjson is not None:
+            with open(file_path, 'wb') as output_file:
+                output_file.write(orjson.dumps(cfg))
+            return
+
         with open(file_path, 'w', encoding='utf8') as output_file:
-            json.dump(
-                {
-                    'is_uncased': self.is_uncased,
-                    'max_vocab': self.max_vocab,
-                    'min_count': self.min_count,
-                    'tk2id': self.tk2id,
-                },
-                output_file,
-                ensure_ascii=False
-            )
+            json.dump(cfg, output_file, ensure_ascii=False)
 
     @classmethod
     def load(cls, exp_name: str):
@@ -197,6 +303,7 @@ class BaseTknzr(abc.ABC):
         Load pre-trained tokenizer using saved configuration.
         This class method only work if pre-trained tokenizer exists under
         :term:`experiment` ``exp_name``.
+        If ``orjson`` is installed, then it will be used to speed up loading.
 
         Parameters
         ==========
@@ -229,7 +336,7 @@ class BaseTknzr(abc.ABC):
         if not exp_name:
             raise ValueError('`exp_name` must be non-empty.')
 
-        file_path = os.path.join(lmp.path.EXP_PATH, exp_name, cls.file_name)
+        _, file_path = cls._file_path(exp_name)
 
         if not os.path.exists(file_path):
             raise FileNotFoundError(' '.join([
@@ -244,15 +351,38 @@ class BaseTknzr(abc.ABC):
                 '`python -m lmp.script.train_tokenizer`.',
             ]))
 
+        # `orjson` read UTF-8 encoded bytes.
+        if orjson is not None:
+            with open(file_path, 'rb') as input_file:
+                return cls(**orjson.loads(input_file.read()))
+
         with open(file_path, 'r', encoding='utf-8') as input_file:
             return cls(**json.load(input_file))
 
+    @classmethod
+    def _file_path(cls, exp_name: str) -> Tuple[str, str]:
+        r"""Get tokenizer's configuration file directory and file path.
+
+        Parameters
+        ==========
+        exp_name: str
+            Name of the experiment.
+
+        Returns
+        =======
+        Tuple[str, str]
+            Experiment directory path and configuration file path.
+        """
+        file_dir = os.path.join(lmp.path.EXP_PATH, exp_name)
+        return file_dir, os.path.join(file_dir, cls.file_name)
+
     def norm(self, txt: str) -> str:
         r"""Perform normalization on text.
 
         text will first be normalized using :py:func:`lmp.dset.util.norm`.
         If ``self.is_uncased == True``, then output text will be converted into
         lowercase.
+        Normalization results of recently normalized text are cached.
 
         Parameters
         ==========
@@ -275,8 +405,34 @@ class BaseTknzr(abc.ABC):
         >>> tknzr.norm('ABC')
         'abc'
         """
+        return self.__class__._norm(txt, self.is_uncased)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _norm(txt: str, is_uncased: bool) -> str:
+        r"""Perform normalization on text with cache.
+
+        Actual implementation of ``self.norm()``.
+        Cache is shared by all tokenizers and keyed by both ``txt`` and
+        ``is_uncased``.
+        Tokenizers normalize same text more than once (for example in
+        ``self.build_vocab()`` and then in ``self.tknz()``), so only recently
+        normalized text is kept.
+
+        Parameters
+        ==========
+        txt: str
+            Text to be normalized.
+        is_uncased: bool
+            Convert text into lowercase if set to ``True``.
+
+        Returns
+        =======
+        str
+            Normalized text.
+        """
         norm_txt = lmp.dset.util.norm(txt)
-        if self.is_uncased:
+        if is_uncased:
             return norm_txt.lower()
         return norm_txt
 
@@ -311,6 +467,33 @@ class BaseTknzr(abc.ABC):
             'method `tknz` not implemented yet.',
         ]))
 
+    def tknz_limit(self, txt: str, limit: int) -> List[str]:
+        r"""Perform :term:`tokenization` on text and keep at most ``limit``
+        tokens.
+
+        Same as ``self.tknz()[:limit]``.
+        Default implementation simply truncates ``self.tknz()``.
+        Subclass should overwrite this method if tokenization can stop after
+        ``limit`` tokens.
+
+        Parameters
+        ==========
+        txt: str
+            Text to be tokenized.
+        limit: int
+            Maximum number of tokens to keep.
+
+        Returns
+        =======
+        List[str]
+            List of at most ``limit`` normalized tokens tokenized from text.
+
+        See Also
+        ========
+        lmp.tknzr.BaseTknzr.tknz
+        """
+        return self.tknz(txt)[:limit]
+
     @abc.abstractmethod
     def dtknz(self, tks: Sequence[str]) -> str:
         r"""Convert :term:`tokens` back to one and only one text.
@@ -346,8 +529,9 @@ class BaseTknzr(abc.ABC):
     def enc(self, txt: str, *, max_seq_len: Optional[int] = -1) -> List[int]:
         r"""Encode text into sequence of :term:`token id`\s.
 
-        Text will first be tokenized using ``self.tknz()``,
-        then format as follow::
+        Text will first be tokenized using ``self.tknz()`` (or
+        ``self.tknz_limit()`` when ``max_seq_len != -1``, so that tokens
+        beyond ``max_seq_len`` are not tokenized), then format as follow::
 
             [bos] tk_1 tk_2 [unk] tk_4 ... tk_n [eos] [pad] ... [pad]
 
@@ -366,6 +550,11 @@ class BaseTknzr(abc.ABC):
            replaced with ``[unk]``.
         6. All tokens will be converted to token ids and returned.
 
+        Encoding results of recently encoded text are cached.
+        Cache size is set by ``self.enc_cache_size``.
+        Cache is cleared when vocabulary is changed by ``self.build_vocab()``
+        or when tokens are added to or removed from ``self.tk2id``.
+
         Parameters
         ==========
         txt: str
@@ -383,32 +572,80 @@ class BaseTknzr(abc.ABC):
 
         See Also
         ========
-        lmp.dset.util.pad_to_max
-        lmp.dset.util.trunc_to_max
         lmp.tknzr.BaseTknzr.dec
         lmp.tknzr.BaseTknzr.tknz
         """
+        return self._get_enc()(txt, max_seq_len)
+
+    def _enc(self, txt: str, max_seq_len: int) -> List[int]:
+        r"""Encode text into sequence of :term:`token id`\s.
+
+        Actual implementation of ``self.enc()``.
+
+        Parameters
+        ==========
+        txt: str
+            Text to be encoded.
+        max_seq_len: int
+            Truncate and pad token ids sequence to maximum sequence length.
+
+        Returns
+        =======
+        List[int]
+            Encoded token ids.
+        """
+        # Bind frequently used attributes to local variables.
+        clss = self.__class__
+        tk2id_get = self.tk2id.get
+        unk_tkid = self.unk_tkid
+
+        # Only tokens which fit into `max_seq_len` need to be tokenized and
+        # converted.
+        # One position is reserved for `[bos]`.
+        if max_seq_len == -1:
+            tks = self.tknz(txt)
+        else:
+            tks = self.tknz_limit(txt, max(0, max_seq_len - 1))
+
         # Prepend `[bos]` token id.
-        tkids = [self.__class__.bos_tkid]
+        tkids = [clss.bos_tkid]
 
         # Convert tokens into token ids.
-        for tk in self.tknz(txt):
-            try:
-                tkids.append(self.tk2id[tk])
-            # Convert unknown tokens into `[unk]` token id.
-            except KeyError:
-                tkids.append(self.unk_tkid)
+        # Unknown tokens are converted into `[unk]` token id.
+        # Lookup is done by `map` so that the loop runs in C.
+        tkids.extend(map(tk2id_get, tks, itertools.repeat(unk_tkid)))
 
         # Append `[eos]` token id.
-        tkids.append(self.__class__.eos_tkid)
+        tkids.append(clss.eos_tkid)
 
-        # First truncate sequence to maximum sequence length, then pad sequence
-        # to maximum sequence length.
-        return lmp.dset.util.pad_to_max(
-            lmp.dset.util.trunc_to_max(tkids, max_seq_len=max_seq_len),
-            self.__class__.pad_tkid,
-            max_seq_len=max_seq_len
-        )
+        if max_seq_len != -1:
+            # Truncate sequence to maximum sequence length.
+            del tkids[max_seq_len:]
+
+            # Pad sequence to maximum sequence length.
+            tkids.extend([clss.pad_tkid] * (max_seq_len - len(tkids)))
+
+        return tkids
+
+    def _enc_tuple(self, txt: str, max_seq_len: int) -> Tuple[int, ...]:
+        r"""Encode text into immutable sequence of :term:`token id`\s.
+
+        Wrapped by ``self._enc_cache`` so that cached results can be safely
+        shared between calls.
+
+        Parameters
+        ==========
+        txt: str
+            Text to be encoded.
+        max_seq_len: int
+            Truncate and pad token ids sequence to maximum sequence length.
+
+        Returns
+        =======
+        Tuple[int, ...]
+            Encoded token ids.
+        """
+        return tuple(self._enc(txt, max_seq_len))
 
     def dec(
             self,
@@ -427,6 +664,8 @@ class BaseTknzr(abc.ABC):
         ``rm_sp_tks == True``.
         If some token ids in sequence are not in tokenizer's inverse lookup
         vocabulary, then they will be converted into ``[unk]`` token.
+        ``tkids`` can also be an 1D :py:class:`numpy.ndarray`, such as a row
+        of ``self.batch_enc_np()`` output.
 
         Parameters
         ==========
@@ -452,23 +691,30 @@ class BaseTknzr(abc.ABC):
         Unknown tokens cannot be converted back to original tokens, so unknown
         tokens should not be removed and serve as a hint of :term:`OOV`.
         """
+        # Bind frequently used attributes to local variables.
+        clss = self.__class__
+        id2tk_get = self.id2tk.get
+        unk_tk = clss.unk_tk
+
         # Remove special token ids.
-        if rm_sp_tks:
-            sp_tkids = [
-                self.__class__.bos_tkid,
-                self.__class__.eos_tkid,
-                self.__class__.pad_tkid,
-            ]
-            tkids = list(filter(lambda tkid: tkid not in sp_tkids, tkids))
-
-        tks = []
+        kept_tkids: Iterable[int] = tkids
+        if isinstance(tkids, np.ndarray):
+            # Filter array with boolean mask, then convert to list of `int`.
+            if rm_sp_tks:
+                tkids = tkids[~np.isin(
+                    tkids,
+                    [clss.bos_tkid, clss.eos_tkid, clss.pad_tkid],
+                )]
+            kept_tkids = tkids.tolist()
+        elif rm_sp_tks:
+            # Filtering is done by `filterfalse` so that the loop runs in C.
+            sp_tkids = {clss.bos_tkid, clss.eos_tkid, clss.pad_tkid}
+            kept_tkids = itertools.filterfalse(sp_tkids.__contains__, tkids)
+
         # Convert token ids into tokens.
-        for tkid in tkids:
-            try:
-                tks.append(self.id2tk[tkid])
-            # Convert unknown token ids into `[unk]` token.
-            except KeyError:
-                tks.append(self.__class__.unk_tk)
+        # Unknown token ids are converted into `[unk]` token.
+        # Lookup is done by `map` so that the loop runs in C.
+        tks = list(map(id2tk_get, kept_tkids, itertools.repeat(unk_tk)))
 
         return self.dtknz(tks)
 
@@ -480,7 +726,8 @@ class BaseTknzr(abc.ABC):
     ) -> List[List[int]]:
         r"""Encode batch of text into batch of sequences of token ids.
 
-        Each text in ``batch_txt`` will be encoded with ``self.enc()``.
+        Each text in ``batch_txt`` will be encoded in the same way as
+        ``self.enc()``.
         All encoded sequence of token ids will have same length.
 
         If ``max_seq_len == -1``, then ``max_seq_len`` will be set to the
@@ -504,33 +751,91 @@ class BaseTknzr(abc.ABC):
 
         See Also
         ========
-        lmp.dset.util.pad_to_max
-        lmp.dset.util.trunc_to_max
         lmp.tknzr.BaseTknzr.batch_dec
         lmp.tknzr.BaseTknzr.enc
         """
-        batch_tkids = [self.enc(txt, max_seq_len=-1) for txt in batch_txt]
+        # Bind frequently used attributes to local variables.
+        enc = self._get_enc()
+        pad_tkid = self.__class__.pad_tkid
+
+        # Each token ids sequence is truncated and padded while encoding.
+        # Encoding results are shared with `self.enc()` through cache.
+        if max_seq_len != -1:
+            return [enc(txt, max_seq_len) for txt in batch_txt]
+
+        # Encode each text in the batch without truncation and padding.
+        batch_tkids = [enc(txt, -1) for txt in batch_txt]
+
+        # If `max_seq_len == -1`, then `max_seq_len` is the longest sequence
+        # length in the batch.
+        max_seq_len = max(map(len, batch_tkids))
+
+        # Pad each token ids sequence in batch to maximum sequence length.
+        for tkids in batch_tkids:
+            tkids.extend([pad_tkid] * (max_seq_len - len(tkids)))
+
+        return batch_tkids
+
+    def batch_enc_np(
+            self,
+            batch_txt: Sequence[str],
+            *,
+            max_seq_len: int = -1,
+    ) -> np.ndarray:
+        r"""Encode batch of text into 2D array of token ids.
+
+        Same as ``self.batch_enc()`` but encoded token ids are written into a
+        pre-allocated :py:class:`numpy.ndarray` with shape
+        ``(len(batch_txt), max_seq_len)`` and ``dtype == numpy.int64``.
+        The result can be converted to ``torch.Tensor`` without copy using
+        :py:func:`torch.from_numpy`.
+
+        Parameters
+        ==========
+        batch_txt: Sequence[str],
+            Batch of text to be encoded.
+        max_seq_len: int, optional
+            Truncate and pad each token ids sequence to maximum sequence
+            length.
+            If ``max_seq_len == -1``, then ``max_seq_len`` will be set to the
+            longest encoded sequence in ``batch_txt``.
+            Defaults to ``-1``
+
+        Returns
+        =======
+        numpy.ndarray
+            Encoded batch of sequence of token ids.
+
+        See Also
+        ========
+        lmp.tknzr.BaseTknzr.batch_enc
+        """
+        # Encode each text in the batch.
+        # If `max_seq_len != -1`, then each token ids sequence is truncated
+        # and padded while encoding.
+        # Encoding results are shared with `self.enc()` through cache.
+        enc = self._get_enc()
+        batch_tkids = [enc(txt, max_seq_len) for txt in batch_txt]
 
         # If `max_seq_len == -1`, then `max_seq_len` is the longest sequence
         # length in the batch.
         if max_seq_len == -1:
             max_seq_len = max(map(len, batch_tkids))
 
-        # Truncate each token ids sequence in batch to maximum sequence length.
-        batch_tkids = [
-            lmp.dset.util.trunc_to_max(tkids, max_seq_len=max_seq_len)
-            for tkids in batch_tkids
-        ]
+        # Fill with `[pad]` token id first, then copy each token ids sequence
+        # into its row.
+        # Sequences are already truncated by `self._enc()` when
+        # `max_seq_len != -1`, and no sequence is longer than the longest one
+        # when `max_seq_len == -1`.
+        out = np.full(
+            (len(batch_tkids), max_seq_len),
+            self.__class__.pad_tkid,
+            dtype=np.int64,
+        )
+        for row, tkids in zip(out, batch_tkids):
+            row[:len(tkids)] = tkids
 
-        # Pad each token ids sequence in batch to maximum sequence length.
-        return [
-            lmp.dset.util.pad_to_max(
-                tkids,
-                self.__class__.pad_tkid,
-                max_seq_len=max_seq_len
-            )
-            for tkids in batch_tkids
-        ]
+        return out
 
     def batch_dec(
             self,
@@ -563,9 +868,15 @@ class BaseTknzr(abc.ABC):
         lmp.tknzr.BaseTknzr.dec
         """
         # Decode each sequence of token ids in the batch.
-        return [self.dec(tkids, rm_sp_tks=rm_sp_tks) for tkids in batch_tkids]
+        dec = self.dec
+        return [dec(tkids, rm_sp_tks=rm_sp_tks) for tkids in batch_tkids]
 
-    def build_vocab(self, batch_txt: Sequence[str]) -> None:
+    def build_vocab(
+            self,
+            batch_txt: Sequence[str],
+            *,
+            n_worker: int = 1,
+    ) -> None:
         r"""Build :term:`vocabulary` for tokenizer.
 
         Build :term:`vocabulary` based on :token:term frequency.
@@ -584,10 +895,19 @@ class BaseTknzr(abc.ABC):
         If the size of the vocabulary already ``>= self.max_vocab``, then
         no new tokens will be added.
 
+        If ``n_worker > 1``, then ``batch_txt`` will be split into
+        ``n_worker`` chunks and token frequency of each chunk will be counted
+        in separate processes.
+        Counting result is the same as counting with single process.
+
         Parameters
         ==========
         batch_txt: Sequence[str]
             Source of text to build vocabulary.
+        n_worker: int, optional
+            Number of processes used to count token frequency.
+            If ``n_worker <= 1``, then count with single process.
+            Defaults to ``1``.
 
         Returns
         =======
@@ -600,32 +920,88 @@ class BaseTknzr(abc.ABC):
         lmp.tknzr.BaseTknzr.vocab_size
         """
         # Count each token's frequency.
-        c: typing.Counter[str] = Counter()
-        for txt in batch_txt:
-            c.update(self.tknz(self.norm(txt)))
-
-        max_id = max(self.tk2id.values()) + 1
-        for tk, tk_count in c.most_common():
-            # Stop adding tokens when pass vocabulary size limit.
-            # If `self.max_vocab == 1`, then add as many tokens as possible.
-            if self.max_vocab != -1 and max_id >= self.max_vocab:
-                break
-
-            # Stop adding the token when the token frequency is low.
-            # Since we sort token by frequency, the rest of tokens will not
-            # have frequency higher than `self.min_count` and thus we can
-            # break loop savely.
-            if tk_count < self.min_count:
-                break
-
-            # Skip the token if already exists.
-            if tk in self.tk2id:
-                continue
-
-            # Add token to vocabulary.
-            self.tk2id[tk] = max_id
-            self.id2tk[max_id] = tk
-            max_id += 1
+        if n_worker > 1:
+            batch_txt = list(batch_txt)
+            chunk_size = max(1, math.ceil(len(batch_txt) / n_worker))
+
+            # Split text into contiguous chunks so that merged counting result
+            # preserves token appearance order.
+            with multiprocessing.Pool(n_worker) as pool:
+                chunk_cs = pool.map(
+                    self._count_tk,
+                    [
+                        batch_txt[i:i + chunk_size]
+                        for i in range(0, len(batch_txt), chunk_size)
+                    ],
+                )
+
+            c: typing.Counter[str] = Counter()
+            for chunk_c in chunk_cs:
+                c.update(chunk_c)
+        else:
+            c = self._count_tk(batch_txt)
+
+        # Drop tokens with frequency lower than `self.min_count` before
+        # sorting.  Most of the tokens in a corpus are rare, so sorting only
+        # the remaining tokens is much cheaper.
+        # Sorting is stable, thus tokens with the same frequency are ordered
+        # by their first appearance, which is the same as `c.most_common()`.
+        min_count = self.min_count
+        freq_tks = sorted(
+            (tk for tk, tk_count in c.items() if tk_count >= min_count),
+            key=c.__getitem__,
+            reverse=True,
+        )
+
+        # Vocabulary may be changed without `self.build_vocab()`.
+        # Recompute next token id if it is already taken.
+        if self._next_id in self.id2tk:
+            self._next_id = max(self.id2tk, default=-1) + 1
+        max_id = self._next_id
+
+        # Skip the token if already exists.
+        new_tks: Iterable[str] = (
+            tk for tk in freq_tks if tk not in self.tk2id
+        )
+
+        # Stop adding tokens when pass vocabulary size limit.
+        # If `self.max_vocab == -1`, then add as many tokens as possible.
+        if self.max_vocab != -1:
+            new_tks = itertools.islice(
+                new_tks,
+                max(0, self.max_vocab - max_id),
+            )
+
+        # Add tokens to vocabulary in bulk.
+        new_tks = list(new_tks)
+        new_tkids = range(max_id, max_id + len(new_tks))
+        self.tk2id.update(zip(new_tks, new_tkids))
+        self.id2tk.update(zip(new_tkids, new_tks))
+        self._next_id = max_id + len(new_tks)
+
+        # Cached encoding results are outdated since vocabulary changed.
+        self._enc_cache.cache_clear()
+
+    def _count_tk(self, batch_txt: Sequence[str]) -> typing.Counter[str]:
+        r"""Count each token's frequency in batch of text.
+
+        Parameters
+        ==========
+        batch_txt: Sequence[str]
+            Source of text to count token frequency.
+
+        Returns
+        =======
+        typing.Counter[str]
+            Token frequency counter.
+        """
+        norm = self.norm
+        tknz = self.tknz
+
+        # Count all tokens with single call so that counting runs in C.
+        return Counter(itertools.chain.from_iterable(
+            tknz(norm(txt)) for txt in batch_txt
+        ))
 
     @property
     def vocab_size(self) -> int:
@@ -679,6 +1055,8 @@ class BaseTknzr(abc.ABC):
         True
         >>> args.min_count == 2
         True
+        >>> args.n_worker == 1
+        True
         >>> args.ver == 'train'
         True
         """
@@ -728,3 +1106,12 @@ class BaseTknzr(abc.ABC):
             action='store_true',
             help='Convert all text and tokens into lowercase if set.',
         )
+        group.add_argument(
+            '--n_worker',
+            default=1,
+            help=' '.join([
+                'Number of processes used to build vocabulary.',
+                'If set to value `<= 1`, then use single process.',
+            ]),
+            type=int,
+        )
@@ -25,6 +25,10 @@ class CharTknzr(BaseTknzr):
         Token (a string) to id (an integer) lookup table.
         If ``tk2id is not None``, then initialize lookup table with ``tk2id``.
         Otherwise initialize lookup table with special tokens only.
+    enc_cache_size: int, optional
+        Maximum number of encoding results cached by ``self.enc()``.
+        Set to ``0`` to disable encoding cache.
+        Defaults to ``65536``.
     kwargs: Dict, optional
         Useless parameter.
         Left intended for subclass parameters extension.
@@ -88,6 +92,41 @@ class CharTknzr(BaseTknzr):
         # First do normalization, then perform tokenization.
         return list(self.norm(txt))
 
+    def tknz_limit(self, txt: str, limit: int) -> List[str]:
+        r"""Perform character :term:`tokenization` and keep at most ``limit``
+        tokens.
+
+        Same as ``self.tknz()[:limit]`` but only the first ``limit``
+        characters are converted into tokens.
+
+        Parameters
+        ==========
+        txt: str
+            Text to be tokenized.
+        limit: int
+            Maximum number of tokens to keep.
+
+        Returns
+        =======
+        List[str]
+            List of at most ``limit`` normalized character tokens tokenized
+            from text.
+
+        See Also
+        ========
+        lmp.tknzr.CharTknzr.tknz
+
+        Examples
+        ========
+        >>> from lmp.tknzr import CharTknzr
+        >>> tknzr = CharTknzr(is_uncased=False, max_vocab=10, min_count=2)
+        >>> tknzr.tknz_limit('abc', 2)
+        ['a', 'b']
+        """
+        # First do normalization, then perform tokenization on the first
+        # `limit` characters.
+        return list(self.norm(txt)[:limit])
+
     def dtknz(self, tks: Sequence[str]) -> str:
         r"""Convert :term:`tokens` back to one and only one text.
 
@@ -26,6 +26,10 @@ class WsTknzr(BaseTknzr):
         Token (a string) to id (an integer) lookup table.
         If ``tk2id is not None``, then initialize lookup table with ``tk2id``.
         Otherwise initialize lookup table with special tokens only.
+    enc_cache_size: int, optional
+        Maximum number of encoding results cached by ``self.enc()``.
+        Set to ``0`` to disable encoding cache.
+        Defaults to ``65536``.
     kwargs: Dict, optional
         Useless parameter.
         Left intended for subclass parameters extension.
@@ -98,6 +102,48 @@ class WsTknzr(BaseTknzr):
             return []
         return tks
 
+    def tknz_limit(self, txt: str, limit: int) -> List[str]:
+        r"""Perform whitespace :term:`tokenization` and keep at most ``limit``
+        tokens.
+
+        Same as ``self.tknz()[:limit]`` but text is only split up to
+        ``limit`` times.
+
+        Parameters
+        ==========
+        txt: str
+            Text to be tokenized.
+        limit: int
+            Maximum number of tokens to keep.
+
+        Returns
+        =======
+        List[str]
+            List of at most ``limit`` normalized tokens tokenized from text.
+
+        See Also
+        ========
+        lmp.tknzr.WsTknzr.tknz
+
+        Examples
+        ========
+        >>> from lmp.tknzr import WsTknzr
+        >>> tknzr = WsTknzr(is_uncased=False, max_vocab=10, min_count=2)
+        >>> tknzr.tknz_limit('abc def ghi', 2)
+        ['abc', 'def']
+        """
+        # First do normalization.
+        # Normalized text has no leading and trailing whitespaces, and
+        # consecutive whitespaces are collapsed into single whitespace, thus
+        # splitting on single whitespace is the same as `self.tknz()`.
+        norm_txt = self.norm(txt)
+
+        # Return empty list when `txt` is empty string.
+        # This is needed since `''.split(' ')` return `['']` instead of `[]`.
+        if not norm_txt:
+            return []
+        return norm_txt.split(' ', limit)[:limit]
+
     def dtknz(self, tks: Sequence[str]) -> str:
         r"""Convert :term:`tokens` back to one and only one text.
 
@@ -0,0 +1,75 @@
+r"""Test vocabulary building.
+
+Test target:
+- :py:meth:`lmp.tknzr.BaseTknzr.build_vocab`.
+"""
+
+from lmp.tknzr import WsTknzr
+from lmp.tknzr._base import BaseTknzr
+
+
+def test_build_vocab_by_freq(subclss_tknzr_clss):
+    r"""Tokens are added in descending frequency order."""
+    tknzr = subclss_tknzr_clss(is_uncased=False, max_vocab=-1, min_count=1)
+    tknzr.build_vocab(['b', 'a', 'a', 'c', 'b', 'a'])
+    assert tknzr.tk2id['a'] == 4
+    assert tknzr.tk2id['b'] == 5
+    assert tknzr.tk2id['c'] == 6
+    assert tknzr.id2tk == {v: k for k, v in tknzr.tk2id.items()}
+
+
+def test_build_vocab_min_count(subclss_tknzr_clss):
+    r"""Tokens with frequency lower than ``min_count`` are not added."""
+    tknzr = subclss_tknzr_clss(is_uncased=False, max_vocab=-1, min_count=2)
+    tknzr.build_vocab(['b', 'a', 'a', 'c', 'b', 'a'])
+    assert 'a' in tknzr.tk2id
+    assert 'b' in tknzr.tk2id
+    assert 'c' not in tknzr.tk2id
+
+
+def test_build_vocab_max_vocab(subclss_tknzr_clss):
+    r"""Vocabulary size does not exceed ``max_vocab``."""
+    tknzr = subclss_tknzr_clss(is_uncased=False, max_vocab=5, min_count=1)
+    tknzr.build_vocab(['b', 'a', 'a', 'c', 'b', 'a'])
+    assert tknzr.vocab_size == 5
+    assert 'a' in tknzr.tk2id
+
+
+def test_build_vocab_skip_existed(subclss_tknzr_clss):
+    r"""Tokens already in vocabulary are not added again."""
+    tknzr = subclss_tknzr_clss(is_uncased=False, max_vocab=-1, min_count=1)
+    tknzr.build_vocab(['a', BaseTknzr.unk_tk])
+    tknzr.build_vocab(['a', 'b'])
+    assert tknzr.tk2id[BaseTknzr.unk_tk] == BaseTknzr.unk_tkid
+    assert tknzr.tk2id['a'] == 4
+    assert tknzr.tk2id['b'] == 5
+    assert tknzr.vocab_size == 6
+
+
+def test_build_vocab_n_worker():
+    r"""Building vocabulary with multiple processes gives the same result."""
+    batch_txt = ['a b c', 'c d', 'e a', 'f g b', 'g a', 'h']
+    tknzr = WsTknzr(is_uncased=False, max_vocab=-1, min_count=1)
+    tknzr.build_vocab(batch_txt)
+    for n_worker in [2, 4]:
+        parallel_tknzr = WsTknzr(is_uncased=False, max_vocab=-1, min_count=1)
+        parallel_tknzr.build_vocab(batch_txt, n_worker=n_worker)
+        assert parallel_tknzr.tk2id == tknzr.tk2id
+        assert parallel_tknzr.id2tk == tknzr.id2tk
+
+        # Empty input does not add any token.
+        empty_tknzr = WsTknzr(is_uncased=False, max_vocab=-1, min_count=1)
+        empty_tknzr.build_vocab([], n_worker=n_worker)
+        assert empty_tknzr.vocab_size == 4
+
+
+def test_build_vocab_after_direct_change(subclss_tknzr_clss):
+    r"""Token ids stay unique when vocabulary is changed directly."""
+    tknzr = subclss_tknzr_clss(is_uncased=False, max_vocab=-1, min_count=1)
+    tknzr.build_vocab(['a'])
+    tknzr.tk2id['x'] = 5
+    tknzr.id2tk[5] = 'x'
+    tknzr.build_vocab(['y'])
+    assert tknzr.tk2id['x'] == 5
+    assert tknzr.tk2id['y'] == 6
+    assert tknzr.id2tk == {v: k for k, v in tknzr.tk2id.items()}
@@ -0,0 +1,64 @@
+r"""Test token ids decoding.
+
+Test target:
+- :py:meth:`lmp.tknzr.BaseTknzr.batch_dec`.
+- :py:meth:`lmp.tknzr.BaseTknzr.dec`.
+"""
+
+import numpy as np
+
+from lmp.tknzr._base import BaseTknzr
+
+
+def test_dec_keep_sp_tks(subclss_tknzr: BaseTknzr):
+    r"""Special tokens are kept when ``rm_sp_tks == False``."""
+    assert subclss_tknzr.dec([
+        BaseTknzr.bos_tkid,
+        BaseTknzr.unk_tkid,
+        BaseTknzr.eos_tkid,
+        BaseTknzr.pad_tkid,
+    ]) == ''.join([
+        BaseTknzr.bos_tk,
+        BaseTknzr.unk_tk,
+        BaseTknzr.eos_tk,
+        BaseTknzr.pad_tk,
+    ])
+
+
+def test_dec_rm_sp_tks(subclss_tknzr: BaseTknzr):
+    r"""Special tokens except `[unk]` are removed when ``rm_sp_tks == True``.
+    """
+    assert subclss_tknzr.dec(
+        [
+            BaseTknzr.bos_tkid,
+            BaseTknzr.unk_tkid,
+            BaseTknzr.eos_tkid,
+            BaseTknzr.pad_tkid,
+        ],
+        rm_sp_tks=True,
+    ) == BaseTknzr.unk_tk
+
+
+def test_dec_unk(subclss_tknzr: BaseTknzr):
+    r"""Unknown token ids are decoded as `[unk]`."""
+    assert subclss_tknzr.dec([-1, 100]) == BaseTknzr.unk_tk * 2
+
+
+def test_batch_dec_consistent_with_dec(subclss_tknzr: BaseTknzr):
+    r"""Each sequence in batch is decoded with ``dec``."""
+    batch_tkids = [[0, 4, 1, 2], [0, 5, 6, 1], [3, 100]]
+    for rm_sp_tks in [True, False]:
+        assert subclss_tknzr.batch_dec(batch_tkids, rm_sp_tks=rm_sp_tks) == [
+            subclss_tknzr.dec(tkids, rm_sp_tks=rm_sp_tks)
+            for tkids in batch_tkids
+        ]
+
+
+def test_dec_np(subclss_tknzr: BaseTknzr):
+    r"""Decoding 1D array is the same as decoding list."""
+    tkids = [0, 4, 3, 100, 1, 2, 2]
+    for rm_sp_tks in [True, False]:
+        assert subclss_tknzr.dec(
+            np.array(tkids),
+            rm_sp_tks=rm_sp_tks,
+        ) == subclss_tknzr.dec(tkids, rm_sp_tks=rm_sp_tks)
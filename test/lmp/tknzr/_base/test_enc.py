@@ -0,0 +1,137 @@
+r"""Test text encoding.
+
+Test target:
+- :py:meth:`lmp.tknzr.BaseTknzr.batch_enc`.
+- :py:meth:`lmp.tknzr.BaseTknzr.batch_enc_np`.
+- :py:meth:`lmp.tknzr.BaseTknzr.enc`.
+"""
+
+import numpy as np
+
+from lmp.tknzr._base import BaseTknzr
+
+
+def test_enc_add_bos_eos(subclss_tknzr: BaseTknzr):
+    r"""Encoded token ids are wrapped with `[bos]` and `[eos]`."""
+    tkids = subclss_tknzr.enc('a')
+    assert tkids[0] == BaseTknzr.bos_tkid
+    assert tkids[-1] == BaseTknzr.eos_tkid
+    assert len(tkids) == 3
+
+
+def test_enc_unk(subclss_tknzr: BaseTknzr):
+    r"""Unknown tokens are encoded as `[unk]`."""
+    assert subclss_tknzr.enc('x') == [
+        BaseTknzr.bos_tkid,
+        BaseTknzr.unk_tkid,
+        BaseTknzr.eos_tkid,
+    ]
+
+
+def test_enc_known(subclss_tknzr: BaseTknzr):
+    r"""Known tokens are encoded with ``tk2id``."""
+    assert subclss_tknzr.enc('a')[1] == subclss_tknzr.tk2id.get(
+        'a',
+        BaseTknzr.unk_tkid,
+    )
+
+
+def test_enc_trunc_and_pad(subclss_tknzr: BaseTknzr):
+    r"""Encoded token ids are truncated and padded to ``max_seq_len``."""
+    assert subclss_tknzr.enc('x', max_seq_len=2) == [
+        BaseTknzr.bos_tkid,
+        BaseTknzr.unk_tkid,
+    ]
+    assert subclss_tknzr.enc('x', max_seq_len=5) == [
+        BaseTknzr.bos_tkid,
+        BaseTknzr.unk_tkid,
+        BaseTknzr.eos_tkid,
+        BaseTknzr.pad_tkid,
+        BaseTknzr.pad_tkid,
+    ]
+
+
+def test_batch_enc_consistent_with_enc(subclss_tknzr: BaseTknzr):
+    r"""Each sequence in batch is encoded in the same way as ``enc``."""
+    batch_txt = ['a', 'b', 'x', '']
+    assert subclss_tknzr.batch_enc(batch_txt) == [
+        subclss_tknzr.enc(txt) for txt in batch_txt
+    ]
+    assert subclss_tknzr.batch_enc(batch_txt, max_seq_len=2) == [
+        subclss_tknzr.enc(txt, max_seq_len=2) for txt in batch_txt
+    ]
+
+
+def test_enc_cache_not_shared(subclss_tknzr: BaseTknzr):
+    r"""Modifying encoded token ids does not affect later encoding."""
+    tkids = subclss_tknzr.enc('a', max_seq_len=4)
+    expected = list(tkids)
+    tkids.append(-1)
+    assert subclss_tknzr.enc('a', max_seq_len=4) == expected
+
+    batch_tkids = subclss_tknzr.batch_enc(['a', 'xy'])
+    batch_tkids[0].append(-1)
+    assert subclss_tknzr.enc('a') == expected[:3]
+
+
+def test_enc_after_build_vocab(subclss_tknzr_clss):
+    r"""Encoding reflects vocabulary changes made by ``build_vocab``."""
+    tknzr = subclss_tknzr_clss(is_uncased=False, max_vocab=-1, min_count=1)
+    assert tknzr.enc('x')[1] == BaseTknzr.unk_tkid
+    tknzr.build_vocab(['x'])
+    assert tknzr.enc('x')[1] == tknzr.tk2id['x']
+
+
+def test_batch_enc_np_consistent_with_batch_enc(subclss_tknzr: BaseTknzr):
+    r"""Encoded array has the same token ids as ``batch_enc``."""
+    batch_txt = ['a', 'b', 'x', '']
+    for max_seq_len in [-1, 2, 5]:
+        batch_tkids = subclss_tknzr.batch_enc_np(
+            batch_txt,
+            max_seq_len=max_seq_len,
+        )
+        assert batch_tkids.dtype == np.int64
+        assert batch_tkids.tolist() == subclss_tknzr.batch_enc(
+            batch_txt,
+            max_seq_len=max_seq_len,
+        )
+
+
+def test_enc_after_direct_vocab_change(subclss_tknzr_clss):
+    r"""Encoding reflects tokens added to ``tk2id`` directly."""
+    tknzr = subclss_tknzr_clss(is_uncased=False, max_vocab=-1, min_count=1)
+    assert tknzr.enc('x') == [
+        BaseTknzr.bos_tkid,
+        BaseTknzr.unk_tkid,
+        BaseTknzr.eos_tkid,
+    ]
+    tknzr.tk2id['x'] = 4
+    tknzr.id2tk[4] = 'x'
+    assert tknzr.enc('x') == [BaseTknzr.bos_tkid, 4, BaseTknzr.eos_tkid]
+    assert tknzr.batch_enc(['x']) == [tknzr.enc('x')]
+    assert tknzr.batch_enc_np(['x']).tolist() == [tknzr.enc('x')]
+
+    tknzr.tk2id = {**tknzr.tk2id, 'y': 5}
+    assert tknzr.enc('y')[1] == 5
+
+
+def test_enc_cache_size(subclss_tknzr_clss):
+    r"""Encoding cache is bounded by ``enc_cache_size``."""
+    tknzr = subclss_tknzr_clss(
+        is_uncased=False,
+        max_vocab=-1,
+        min_count=1,
+        enc_cache_size=1,
+    )
+    tknzr.enc('a')
+    tknzr.enc('b')
+    assert tknzr._enc_cache.cache_info().currsize == 1
+
+    tknzr = subclss_tknzr_clss(
+        is_uncased=False,
+        max_vocab=-1,
+        min_count=1,
+        enc_cache_size=0,
+    )
+    assert tknzr.enc('a') == tknzr.enc('a')
+    assert tknzr._enc_cache.cache_info().currsize == 0
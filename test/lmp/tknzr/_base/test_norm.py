@@ -33,3 +33,25 @@ def test_lower_case(subclss_tknzr: BaseTknzr, case_txt: Dict[str, str]):
         assert subclss_tknzr.norm(case_txt['input']) == case_txt['output']
     else:
         assert subclss_tknzr.norm(case_txt['input']) == case_txt['input']
+
+
+def test_cache_keyed_by_case(subclss_tknzr_clss, case_txt: Dict[str, str]):
+    r"""Cased and uncased tokenizers do not share normalization results."""
+    cased_tknzr = subclss_tknzr_clss(
+        is_uncased=False,
+        max_vocab=-1,
+        min_count=1,
+    )
+    uncased_tknzr = subclss_tknzr_clss(
+        is_uncased=True,
+        max_vocab=-1,
+        min_count=1,
+    )
+    for _ in range(2):
+        assert cased_tknzr.norm(case_txt['input']) == case_txt['input']
+        assert uncased_tknzr.norm(case_txt['input']) == case_txt['output']
+
+
+def test_cache_bounded():
+    r"""Normalization cache is bounded."""
+    assert BaseTknzr._norm.cache_info().maxsize == 4096
@@ -51,3 +51,25 @@ def test_load_result(
     assert subclss_tknzr.max_vocab == load_tknzr.max_vocab
     assert subclss_tknzr.min_count == load_tknzr.min_count
     assert subclss_tknzr.tk2id == load_tknzr.tk2id
+
+
+@pytest.mark.usefixtures('file_path')
+def test_load_result_without_orjson(
+        exp_name: str,
+        monkeypatch,
+        subclss_tknzr: BaseTknzr,
+        subclss_tknzr_clss: Type[BaseTknzr],
+):
+    r"""Configuration is consistent when falling back to standard ``json``.
+    """
+    subclss_tknzr.save(exp_name)
+    monkeypatch.setattr('lmp.tknzr._base.orjson', None)
+    load_tknzr = subclss_tknzr_clss.load(exp_name)
+    assert subclss_tknzr.tk2id == load_tknzr.tk2id
+
+    load_tknzr.save(exp_name)
+    load_tknzr = subclss_tknzr_clss.load(exp_name)
+    assert subclss_tknzr.is_uncased == load_tknzr.is_uncased
+    assert subclss_tknzr.max_vocab == load_tknzr.max_vocab
+    assert subclss_tknzr.min_count == load_tknzr.min_count
+    assert subclss_tknzr.tk2id == load_tknzr.tk2id
@@ -6,6 +6,8 @@ from inspect import Parameter, Signature
 from typing import (ClassVar, Dict, List, Optional, Sequence, Union,
                     get_type_hints)
 
+import numpy as np
+
 from lmp.tknzr._base import BaseTknzr
 
 
@@ -96,6 +98,12 @@ def test_instance_method(subclss_tknzr):
                 default=None,
                 annotation=Optional[Dict[str, int]],
             ),
+            Parameter(
+                name='enc_cache_size',
+                kind=Parameter.KEYWORD_ONLY,
+                default=65536,
+                annotation=int,
+            ),
             Parameter(
                 name='kwargs',
                 kind=Parameter.VAR_KEYWORD,
@@ -128,6 +136,30 @@ def test_instance_method(subclss_tknzr):
         ],
         return_annotation=List[List[int]],
     )
+    assert hasattr(BaseTknzr, 'batch_enc_np')
+    assert inspect.ismethod(subclss_tknzr.batch_enc_np)
+    assert inspect.signature(BaseTknzr.batch_enc_np) == Signature(
+        parameters=[
+            Parameter(
+                name='self',
+                kind=Parameter.POSITIONAL_OR_KEYWORD,
+                default=Parameter.empty,
+            ),
+            Parameter(
+                name='batch_txt',
+                kind=Parameter.POSITIONAL_OR_KEYWORD,
+                default=Parameter.empty,
+                annotation=Sequence[str],
+            ),
+            Parameter(
+                name='max_seq_len',
+                kind=Parameter.KEYWORD_ONLY,
+                default=-1,
+                annotation=int,
+            ),
+        ],
+        return_annotation=np.ndarray,
+    )
     assert hasattr(BaseTknzr, 'batch_dec')
     assert inspect.ismethod(subclss_tknzr.batch_dec)
     assert inspect.signature(BaseTknzr.batch_dec) == Signature(
@@ -168,6 +200,12 @@ def test_instance_method(subclss_tknzr):
                 default=Parameter.empty,
                 annotation=Sequence[str],
             ),
+            Parameter(
+                name='n_worker',
+                kind=Parameter.KEYWORD_ONLY,
+                default=1,
+                annotation=int,
+            ),
         ],
         return_annotation=None,
     )
@@ -297,6 +335,31 @@ def test_instance_method(subclss_tknzr):
         return_annotation=List[str],
     )
 
+    assert hasattr(BaseTknzr, 'tknz_limit')
+    assert inspect.ismethod(subclss_tknzr.tknz_limit)
+    assert inspect.signature(BaseTknzr.tknz_limit) == Signature(
+        parameters=[
+            Parameter(
+                name='self',
+                kind=Parameter.POSITIONAL_OR_KEYWORD,
+                default=Parameter.empty,
+            ),
+            Parameter(
+                name='txt',
+                kind=Parameter.POSITIONAL_OR_KEYWORD,
+                default=Parameter.empty,
+                annotation=str,
+            ),
+            Parameter(
+                name='limit',
+                kind=Parameter.POSITIONAL_OR_KEYWORD,
+                default=Parameter.empty,
+                annotation=int,
+            ),
+        ],
+        return_annotation=List[str],
+    )
+
 
 def test_abstract_method():
     r"""Ensure abstract method's signature."""
@@ -315,6 +378,7 @@ def test_instance_attribute(
     assert subclss_tknzr.is_uncased == is_uncased
     assert subclss_tknzr.max_vocab == max_vocab
     assert subclss_tknzr.min_count == min_count
+    assert subclss_tknzr.enc_cache_size == 65536
     if tk2id is not None:
         assert subclss_tknzr.tk2id == tk2id
         assert subclss_tknzr.id2tk == {v: k for k, v in tk2id.items()}
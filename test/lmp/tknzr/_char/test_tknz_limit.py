@@ -0,0 +1,24 @@
+r"""Test character tokenization with limit.
+
+Test target:
+- :py:meth:`lmp.tknzr.CharTknzr.tknz_limit`.
+"""
+
+import pytest
+
+from lmp.tknzr import CharTknzr
+
+
+@pytest.mark.parametrize('txt', [
+    '',
+    '  ',
+    'abc',
+    ' abc  def\tghi\n',
+    'ＡＢＣ ａｂｃ',
+])
+def test_same_as_tknz(is_uncased: bool, txt: str):
+    r"""Tokens are the same as truncated ``tknz`` output."""
+    tknzr = CharTknzr(is_uncased=is_uncased, max_vocab=-1, min_count=1)
+    tks = tknzr.tknz(txt)
+    for limit in range(len(tks) + 2):
+        assert tknzr.tknz_limit(txt, limit) == tks[:limit]
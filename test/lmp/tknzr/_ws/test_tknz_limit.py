@@ -0,0 +1,37 @@
+r"""Test whitespace tokenization with limit.
+
+Test target:
+- :py:meth:`lmp.tknzr.WsTknzr.tknz_limit`.
+"""
+
+import pytest
+
+from lmp.tknzr import WsTknzr
+
+
+@pytest.mark.parametrize('txt', [
+    '',
+    '  ',
+    'a b c',
+    ' abc  def\tghi\n',
+    'ＡＢＣ ａｂｃ',
+])
+def test_same_as_tknz(is_uncased: bool, txt: str):
+    r"""Tokens are the same as truncated ``tknz`` output."""
+    tknzr = WsTknzr(is_uncased=is_uncased, max_vocab=-1, min_count=1)
+    tks = tknzr.tknz(txt)
+    for limit in range(len(tks) + 2):
+        assert tknzr.tknz_limit(txt, limit) == tks[:limit]
+
+
+def test_enc_with_max_seq_len(is_uncased: bool):
+    r"""Encoding with ``max_seq_len`` is the same as truncating full encoding.
+    """
+    tknzr = WsTknzr(is_uncased=is_uncased, max_vocab=-1, min_count=1)
+    tknzr.build_vocab(['a b c'])
+    tkids = tknzr.enc('a b c d e')
+    for max_seq_len in range(len(tkids) + 2):
+        assert tknzr.enc('a b c d e', max_seq_len=max_seq_len) == (
+            tkids[:max_seq_len]
+            + [WsTknzr.pad_tkid] * (max_seq_len - len(tkids))
+        )